@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# Startup and analysis benchmark for the commit_analyzer CLI.
+#
+#   python .github/scripts/benchmark.py [--runs 10] [--backfill 20] [--max-import-ms 50]
+#
+# Reports the import time of commit_analyzer.cli (from -X importtime), the
+# wall time of a cold `python -m commit_analyzer --version`, and checks that
+# the modules we import lazily have not crept back into the startup path.
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Modules that must only be imported when an upload (or profiling) happens.
+LAZY_MODULES = [
+    "commit_analyzer.upload",
+    "urllib.request",
+    "http.client",
+    "hmac",
+    "json",
+    "cProfile",
+    "requests",
+]
+
+def python_env():
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [SCRIPTS_DIR, env.get("PYTHONPATH")]))
+    # Compiled bytecode is cached after the first run, as it is on a warm runner.
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return env
+
+def import_time_us(env):
+    """Returns the cumulative import time of commit_analyzer.cli in microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import commit_analyzer.cli"],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    for line in result.stderr.splitlines():
+        # "import time:  self [us] | cumulative | imported package"
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == "commit_analyzer.cli":
+            return int(parts[1])
+    raise RuntimeError("commit_analyzer.cli missing from -X importtime output")
+
+def cold_start_seconds(env):
+    started = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "commit_analyzer", "--version"],
+        env=env, capture_output=True, check=True,
+    )
+    return time.perf_counter() - started
+
+def loaded_lazy_modules(env):
+    check = (
+        "import sys, commit_analyzer.cli; "
+        f"print(' '.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", check], env=env, capture_output=True, text=True, check=True,
+    )
+    return result.stdout.split()
+
+def backfill_seconds(env, max_count):
+    started = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "commit_analyzer", "backfill", "--max-count", str(max_count)],
+        env=env, capture_output=True, check=True,
+    )
+    return time.perf_counter() - started
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark commit_analyzer startup and analysis.")
+    parser.add_argument("--runs", type=int, default=10, help="number of runs per measurement")
+    parser.add_argument("--backfill", type=int, default=0, metavar="N",
+                        help="also time `backfill --max-count N` on the current repository")
+    parser.add_argument("--max-import-ms", type=float, metavar="MS",
+                        help="fail if the median import time exceeds MS")
+    args = parser.parse_args(argv)
+
+    env = python_env()
+    # Warm up the bytecode cache so it is not counted in the first run.
+    import_time_us(env)
+
+    import_ms = statistics.median(import_time_us(env) for _ in range(args.runs)) / 1000
+    startup_ms = statistics.median(cold_start_seconds(env) for _ in range(args.runs)) * 1000
+    eager = loaded_lazy_modules(env)
+
+    print("Benchmark Results:")
+    print("-" * 25)
+    print(f"Import time (commit_analyzer.cli): {import_ms:.2f} ms")
+    print(f"Cold start (--version): {startup_ms:.2f} ms")
+    print(f"Lazy modules imported at startup: {', '.join(eager) or 'none'}")
+    if args.backfill:
+        backfill_s = statistics.median(backfill_seconds(env, args.backfill) for _ in range(args.runs))
+        print(f"Backfill of {args.backfill} commits: {backfill_s:.3f} s")
+
+    failed = bool(eager)
+    if args.max_import_ms is not None and import_ms > args.max_import_ms:
+        print(f"Import time exceeds {args.max_import_ms} ms")
+        failed = True
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+# Builds commit-analysis.pyz, a self-contained zipapp of the commit_analyzer CLI.
+#
+#   python .github/scripts/build_zipapp.py [-o commit-analysis.pyz]
+#   python commit-analysis.pyz analyze
+import argparse
+import os
+import zipapp
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def include(path):
+    """Only package the commit_analyzer sources, not the legacy scripts or caches."""
+    return path.parts[0] == "commit_analyzer" and "__pycache__" not in path.parts
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the commit-analysis zipapp.")
+    parser.add_argument("-o", "--output", default="commit-analysis.pyz", help="output path")
+    args = parser.parse_args(argv)
+
+    zipapp.create_archive(
+        SCRIPTS_DIR,
+        target=args.output,
+        interpreter="/usr/bin/env python3",
+        main="commit_analyzer.cli:main",
+        filter=include,
+        compressed=True,
+    )
+    print(f"Built {args.output}")
+
+if __name__ == "__main__":
+    main()
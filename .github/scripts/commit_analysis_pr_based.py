@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 
 # PR Based Commit Analysis
+import argparse
 import subprocess
 import re
 from datetime import datetime, timedelta
 
+from commit_analyzer import profiling
+
 DEBUG = True
 THIRTY_DAYS = timedelta(days=30)
 
@@ -15,13 +18,18 @@ def debug_log(message):
 def run_command(cmd):
     """Runs a shell command and returns its output as text."""
     debug_log(f"Running command: {cmd}")
-    try:
-        output = subprocess.check_output(cmd, shell=True, text=True).strip()
-        debug_log(f"Command output: {output}")
-        return output
-    except subprocess.CalledProcessError as e:
-        debug_log(f"Command failed: {e}")
-        return ""
+    with profiling.trace_command(cmd) as trace:
+        try:
+            output = subprocess.check_output(cmd, shell=True, text=True)
+        except subprocess.CalledProcessError as e:
+            trace["returncode"] = e.returncode
+            debug_log(f"Command failed: {e}")
+            return ""
+        if profiling.is_enabled():
+            trace["bytes_read"] = len(output.encode("utf-8"))
+    output = output.strip()
+    debug_log(f"Command output: {output}")
+    return output
 
 def get_commit_list():
     """Fetches all commits in the current PR, excluding merge commits, and appends one more old commit."""
@@ -93,7 +101,26 @@ def analyze_commit(commit1, commit2):
     print("Refactors:", refactor_count)
     print("-------------------------------------")
 
-if __name__ == "__main__":
+def run_analysis():
     commits = get_commit_list()
     for i in range(len(commits) - 1):
         analyze_commit(commits[i], commits[i + 1])
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PR based commit analysis.")
+    parser.add_argument(
+        "--profile", nargs="?", const="profile", metavar="DIR",
+        help="run under cProfile and write profiling output to DIR (default: ./profile)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.profile:
+        profiling.start()
+    try:
+        run_analysis()
+    finally:
+        if args.profile:
+            profiling.stop_and_write(args.profile)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+"""Per commit work breakdown analysis (new feature / rewrite / refactor)."""
+
+__version__ = "0.1.0"
@@ -0,0 +1,3 @@
+from commit_analyzer.cli import main
+
+main()
@@ -0,0 +1,294 @@
+# Per Commit Analysis - considered ONLY REMOVED lines cases in this
+import os
+import re
+import subprocess
+from datetime import datetime, timedelta
+
+from commit_analyzer import profiling
+
+# Set DEBUG to True to enable debug logs.
+DEBUG = True
+
+# Define the 30-day threshold
+THIRTY_DAYS = timedelta(days=30)
+
+# Define files and folders to ignore
+IGNORED_FILES = {
+    # Files
+    '.env',
+    '.env.example',
+    '.gitignore',
+    'package.json',
+    'package-lock.json',
+    'pnpm-lock.json',
+    'tsconfig.json',
+    'tsconfig.node.json',
+    'tsconfig.app.json',
+    'tsconfig.spec.json',
+    'readme.md'
+}
+
+IGNORED_FOLDERS = {
+        'node_modules',
+        '.git',
+        '.github',
+        'dist',
+        'build',
+        'coverage',
+        '.husky',
+        '.vscode',
+        '.idea'
+    }
+
+def debug_log(message):
+    if DEBUG:
+        print("[DEBUG]", message)
+
+def run_command(cmd):
+    """Runs a shell command and returns its output as text."""
+    debug_log(f"Running command: {cmd}")
+    with profiling.trace_command(cmd) as trace:
+        try:
+            output = subprocess.check_output(cmd, shell=True, text=True)
+        except subprocess.CalledProcessError as e:
+            trace["returncode"] = e.returncode
+            debug_log(f"Command failed: {e}")
+            return ""
+        if profiling.is_enabled():
+            trace["bytes_read"] = len(output.encode("utf-8"))
+    debug_log(f"Command output: {output.strip()}")
+    return output
+
+def get_commit_timestamp():
+    """Gets the commit timestamp of HEAD."""
+    ts_str = run_command("git show -s --format=%ct HEAD").strip()
+    commit_ts = datetime.fromtimestamp(int(ts_str))
+    debug_log(f"Commit timestamp: {commit_ts}")
+    return commit_ts
+
+def get_push_commits(base_sha=None, head_sha=None):
+    """Gets all non-merge commits in the PR."""
+    # Each side falls back to its environment variable, then to HEAD~1..HEAD
+    head_sha = head_sha or os.environ.get('PR_HEAD_SHA')
+    if not head_sha:
+        debug_log("No PR head SHA found, falling back to HEAD")
+        head_sha = run_command("git rev-parse HEAD").strip()
+    
+    base_sha = base_sha or os.environ.get('PR_BASE_SHA')
+    if not base_sha:
+        debug_log(f"No PR base SHA found, falling back to {head_sha}~1")
+        base_sha = run_command(f"git rev-parse {head_sha}~1").strip()
+    
+    debug_log(f"Base SHA: {base_sha}")
+    debug_log(f"Head SHA: {head_sha}")
+    
+    return get_commits(f"{base_sha}..{head_sha}")
+
+def get_commits(rev_range, max_count=None):
+    """Gets all non-merge commits in a git revision range, newest first."""
+    # Using --no-merges to exclude merge commits and format to get commit hash and subject
+    limit = f" --max-count={int(max_count)}" if max_count else ""
+    cmd = f"git log --no-merges{limit} --format='%H %s' {rev_range}"
+    output = run_command(cmd).strip()
+    
+    if not output:
+        debug_log("No commits found in range")
+        return []
+    
+    # Split output into lines and extract commit hashes
+    commits = []
+    for line in output.split('\n'):
+        if line.strip():
+            commit_hash = line.split()[0]
+            commit_subject = ' '.join(line.split()[1:])
+            debug_log(f"Found commit: {commit_hash[:8]} - {commit_subject}")
+            commits.append(commit_hash)
+    
+    debug_log(f"Total non-merge commits found: {len(commits)}")
+    return commits
+
+def is_ignored_path(file_path):
+    """Check if a file path should be ignored."""
+    debug_log(f"\nChecking path: {file_path}")
+    
+    # Convert path to lowercase for case-insensitive comparison
+    file_path = file_path.lower().strip('/')
+    debug_log(f"Lowercase path: {file_path}")
+    
+    # Check if the file is in the ignored list
+    if any(file_path.endswith(ignored.lower()) for ignored in IGNORED_FILES):
+        debug_log(f"File matches ignored file pattern: {file_path}")
+        return True
+    
+    # Split the path into parts
+    path_parts = file_path.split('/')
+    
+    # Check if any part of the path matches an ignored folder
+    for folder in IGNORED_FOLDERS:
+        folder = folder.lower()
+        # Check if the file is in an ignored folder
+        if folder in path_parts:
+            debug_log(f"File is in ignored folder: {folder}")
+            return True
+        
+        # Check if the file path starts with an ignored folder
+        if file_path.startswith(f"{folder}/"):
+            debug_log(f"File path starts with ignored folder: {folder}")
+            return True
+    
+    debug_log("Path is not ignored")
+    return False
+
+def get_file_chunks(diff_output):
+    """Organizes diff output into file-wise chunks."""
+    file_chunks = {}
+    current_file = None
+    current_chunks = []
+    
+    for line in diff_output.splitlines():
+        if line.startswith('diff --git'):
+            # If we have a previous file, save its chunks
+            if current_file:
+                file_chunks[current_file] = current_chunks
+            
+            # Start new file
+            m = re.search(r' b/(.+)$', line)
+            if m:
+                current_file = m.group(1)
+                current_chunks = [line]
+        elif current_file:
+            current_chunks.append(line)
+    
+    # Save the last file's chunks
+    if current_file and current_chunks:
+        file_chunks[current_file] = current_chunks
+    
+    return file_chunks
+
+def analyze_specific_commit(commit_hash):
+    """Analyzes a specific commit and returns analysis metrics."""
+    debug_log(f"Analyzing commit: {commit_hash}")
+    
+    # Get repository and organization IDs from environment variables
+    repo_id = f"gh_repo_{os.environ.get('GITHUB_REPOSITORY_ID', '')}"
+    org_id = f"gh_org_{os.environ.get('GITHUB_ORGANIZATION_ID', '')}"
+    
+    # Get the commit timestamp for this specific commit
+    ts_str = run_command(f"git show -s --format=%ct {commit_hash}").strip()
+    commit_time = datetime.fromtimestamp(int(ts_str))
+    
+    # Get the diff for this specific commit
+    diff_output = run_command(f"git diff {commit_hash}^ {commit_hash}")
+    debug_log("Diff output received")
+    
+    # Initialize counters
+    new_feature_count = 0
+    rewrite_count = 0
+    refactor_count = 0
+    
+    # Get file-wise chunks
+    file_chunks = get_file_chunks(diff_output)
+    
+    # Process each file's chunks
+    for file_path, chunks in file_chunks.items():
+        # Skip if file should be ignored
+        if is_ignored_path(file_path):
+            debug_log(f"Skipping ignored file: {file_path}")
+            continue
+            
+        debug_log(f"Processing file: {file_path}")
+        
+        # Process chunks for this file
+        old_line_num = None
+        new_line_num = None
+        removed_lines_buffer = []
+        hunk_header_regex = re.compile(r'^@@ -(\d+)(?:,\d+)? \+(\d+)(?:,\d+)? @@')
+        
+        for line in chunks:
+            if line.startswith('@@'):
+                m = hunk_header_regex.match(line)
+                if m:
+                    old_line_num = int(m.group(1))
+                    new_line_num = int(m.group(2))
+                    removed_lines_buffer = []
+                    debug_log(f"Hunk header found. Starting old_line_num: {old_line_num}, new_line_num: {new_line_num}")
+            elif old_line_num is None or new_line_num is None:
+                continue
+            elif line.startswith(" "):
+                old_line_num += 1
+                new_line_num += 1
+            elif line.startswith("-"):
+                debug_log(f"Removed line at old_line_num: {old_line_num}")
+                removed_lines_buffer.append(old_line_num)
+                old_line_num += 1
+            elif line.startswith("+"):
+                if removed_lines_buffer:
+                    removal_line_num = removed_lines_buffer.pop(0)
+                    blame_cmd = f'git blame -p -L {removal_line_num},{removal_line_num} {commit_hash}^ -- "{file_path}"'
+                    blame_output = run_command(blame_cmd)
+                    m_time = re.search(r'author-time (\d+)', blame_output)
+                    if m_time:
+                        blame_timestamp = datetime.fromtimestamp(int(m_time.group(1)))
+                        delta = commit_time - blame_timestamp
+                        debug_log(f"Blame timestamp for {removal_line_num} in {file_path}: {blame_timestamp} (delta: {delta})")
+                        if delta <= THIRTY_DAYS:
+                            rewrite_count += 1
+                            debug_log("Classified as rewrite")
+                        else:
+                            refactor_count += 1
+                            debug_log("Classified as refactor")
+                    new_line_num += 1
+                else:
+                    new_feature_count += 1
+                    debug_log(f"Added line at new_line_num: {new_line_num} classified as new feature")
+                    new_line_num += 1
+        
+        # Process remaining removals for this file
+        for removal_line_num in removed_lines_buffer:
+            blame_cmd = f'git blame -p -L {removal_line_num},{removal_line_num} {commit_hash}^ -- "{file_path}"'
+            blame_output = run_command(blame_cmd)
+            m_time = re.search(r'author-time (\d+)', blame_output)
+            if m_time:
+                blame_timestamp = datetime.fromtimestamp(int(m_time.group(1)))
+                delta = commit_time - blame_timestamp
+                debug_log(f"Blame timestamp for removed line {removal_line_num} in {file_path}: {blame_timestamp} (delta: {delta})")
+                if delta <= THIRTY_DAYS:
+                    rewrite_count += 1
+                    debug_log("Classified removed-only as rewrite")
+                else:
+                    refactor_count += 1
+                    debug_log("Classified removed-only as refactor")
+    
+    return {
+        "commitId": commit_hash,
+        "repoId": repo_id,
+        "organizationId": org_id,
+        "workbreakdown": {
+            "newFeature": new_feature_count,
+            "refactor": refactor_count,
+            "rewrite": rewrite_count
+        }
+    }
+
+def analyze_commits(commits):
+    """Analyzes each commit in turn, printing the individual results."""
+    commit_analyses = []
+    
+    for commit in commits:
+        result = analyze_specific_commit(commit)
+        commit_analyses.append(result)
+        
+        # Print individual commit results in JSON format
+        print(f"\nCommit Analysis:")
+        print(result)
+    
+    return commit_analyses
+
+def print_summary(commit_analyses):
+    """Prints the totals across all analyzed commits."""
+    print("\nAnalysis Summary:")
+    print("-" * 25)
+    print(f"Total Commits Analyzed: {len(commit_analyses)}")
+    print(f"Total New Features: {sum(c['workbreakdown']['newFeature'] for c in commit_analyses)}")
+    print(f"Total Rewrites: {sum(c['workbreakdown']['rewrite'] for c in commit_analyses)}")
+    print(f"Total Refactors: {sum(c['workbreakdown']['refactor'] for c in commit_analyses)}")
@@ -0,0 +1,124 @@
+# Command line entry point: commit-analysis {analyze,backfill,send}
+#
+# Keep the imports here light. json and the upload module (hmac + the HTTP
+# stack) are imported inside the commands that need them so that startup
+# stays fast; benchmark.py reports the import time of this module.
+import argparse
+import sys
+
+from commit_analyzer import __version__, analysis, profiling
+
+def write_analyses(commit_analyses, path):
+    """Writes the analyses as JSON, in the same form the API receives."""
+    import json
+
+    with open(path, "w") as f:
+        json.dump(commit_analyses, f, sort_keys=True, indent=2)
+    print(f"Wrote {len(commit_analyses)} commit analyses to {path}")
+
+def send(commit_analyses):
+    from commit_analyzer.upload import send_analyses
+
+    return 0 if send_analyses(commit_analyses) else 1
+
+def run_analyze(args):
+    """Analyzes every commit in the PR and sends the results to the API."""
+    commits = analysis.get_push_commits(args.base, args.head)
+    analysis.debug_log(f"Found {len(commits)} commits to analyze")
+    commit_analyses = analysis.analyze_commits(commits)
+    analysis.print_summary(commit_analyses)
+
+    if args.output:
+        write_analyses(commit_analyses, args.output)
+    if args.no_send:
+        return 0
+    return send(commit_analyses)
+
+def run_backfill(args):
+    """Analyzes historical commits, writing the results and optionally sending them."""
+    commits = analysis.get_commits(args.rev_range, args.max_count)
+    analysis.debug_log(f"Found {len(commits)} commits to backfill")
+    commit_analyses = analysis.analyze_commits(commits)
+    analysis.print_summary(commit_analyses)
+
+    if args.output:
+        write_analyses(commit_analyses, args.output)
+    if not args.send:
+        return 0
+    return send(commit_analyses)
+
+def run_send(args):
+    """Sends previously written analyses to the API."""
+    import json
+
+    if args.input == "-":
+        commit_analyses = json.load(sys.stdin)
+    else:
+        with open(args.input) as f:
+            commit_analyses = json.load(f)
+    return send(commit_analyses)
+
+def build_parser():
+    common = argparse.ArgumentParser(add_help=False)
+    # --profile takes no value so it cannot swallow a subcommand's positional
+    # argument, e.g. `backfill --profile HEAD~10..HEAD`.
+    common.add_argument(
+        "--profile", action="store_true",
+        help="run under cProfile and write profiling output to --profile-dir",
+    )
+    common.add_argument(
+        "--profile-dir", default="profile", metavar="DIR",
+        help="directory for profiling output (default: ./profile)",
+    )
+
+    parser = argparse.ArgumentParser(
+        prog="commit-analysis",
+        description="Per commit work breakdown analysis.",
+    )
+    parser.add_argument("--version", action="version", version=__version__)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    analyze = subparsers.add_parser(
+        "analyze", parents=[common],
+        help="analyze the commits of a PR and send them to the API",
+    )
+    analyze.add_argument("--base", help="PR base SHA (default: $PR_BASE_SHA, else HEAD~1)")
+    analyze.add_argument("--head", help="PR head SHA (default: $PR_HEAD_SHA, else HEAD)")
+    analyze.add_argument("--output", metavar="FILE", help="also write the analyses to FILE as JSON")
+    analyze.add_argument("--no-send", action="store_true", help="do not send the analyses to the API")
+    analyze.set_defaults(func=run_analyze)
+
+    backfill = subparsers.add_parser(
+        "backfill", parents=[common],
+        help="analyze historical commits",
+    )
+    backfill.add_argument("rev_range", nargs="?", default="HEAD", help="git revision range (default: HEAD)")
+    backfill.add_argument("--max-count", type=int, metavar="N", help="analyze at most N commits")
+    backfill.add_argument("--output", metavar="FILE", help="write the analyses to FILE as JSON")
+    backfill.add_argument("--send", action="store_true", help="send the analyses to the API")
+    backfill.set_defaults(func=run_backfill)
+
+    send_parser = subparsers.add_parser(
+        "send", parents=[common],
+        help="send analyses written with --output to the API",
+    )
+    send_parser.add_argument("input", metavar="FILE", help="JSON file of analyses, or - for stdin")
+    send_parser.set_defaults(func=run_send)
+
+    return parser
+
+def main(argv=None):
+    """Runs the CLI and exits with the command's status.
+
+    Exits rather than returning so that the zipapp, whose generated
+    __main__ ignores the return value, still reports failed uploads.
+    """
+    args = build_parser().parse_args(argv)
+
+    if args.profile:
+        profiling.start()
+    try:
+        sys.exit(args.func(args))
+    finally:
+        if args.profile:
+            profiling.stop_and_write(args.profile_dir)
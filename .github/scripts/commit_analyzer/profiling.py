@@ -0,0 +1,147 @@
+# Profiling support for the commit analysis scripts
+#
+# When enabled, this runs cProfile around the analysis pipeline, records a
+# trace of every git subprocess (argv, duration, bytes read) and samples the
+# main thread's stack so that a collapsed-stack file can be fed straight to
+# flamegraph.pl, speedscope or inferno.
+#
+# cProfile and pstats are only imported once profiling starts so that a
+# normal run does not pay for them at startup.
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+# Interval (in seconds) between stack samples for the collapsed-stack output.
+SAMPLE_INTERVAL = 0.001
+
+_profiler = None
+_sampler = None
+_stop_sampling = None
+_stacks = {}
+_subprocess_trace = []
+_current_command = None
+
+def is_enabled():
+    return _profiler is not None
+
+def start():
+    """Starts cProfile and the stack sampler for the calling thread."""
+    global _profiler, _sampler, _stop_sampling
+    if _profiler is not None:
+        return
+    import cProfile
+
+    _stacks.clear()
+    _subprocess_trace.clear()
+    _stop_sampling = threading.Event()
+    _sampler = threading.Thread(
+        target=_sample_stacks,
+        args=(threading.get_ident(),),
+        name="profiling-sampler",
+        daemon=True,
+    )
+    _sampler.start()
+    _profiler = cProfile.Profile()
+    _profiler.enable()
+
+def _frame_label(frame):
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+def _sample_stacks(thread_id):
+    """Periodically records the stack of the profiled thread, weighted in microseconds."""
+    last = time.perf_counter()
+    while not _stop_sampling.wait(SAMPLE_INTERVAL):
+        now = time.perf_counter()
+        weight = int((now - last) * 1_000_000)
+        last = now
+        frame = sys._current_frames().get(thread_id)
+        if frame is None or weight <= 0:
+            continue
+        stack = []
+        while frame is not None:
+            stack.append(_frame_label(frame))
+            frame = frame.f_back
+        stack.reverse()
+        # Attribute time spent waiting on git to the command being run.
+        command = _current_command
+        if command is not None:
+            stack.append(f"[{command}]")
+        key = ";".join(stack)
+        _stacks[key] = _stacks.get(key, 0) + weight
+
+@contextmanager
+def trace_command(cmd):
+    """Records argv, duration and bytes read for a subprocess while profiling.
+
+    Yields a dict the caller fills in with ``bytes_read`` and ``returncode``.
+    ``bytes_read`` is the UTF-8 length of the output after ``text=True`` has
+    decoded it and normalised newlines, so it undercounts CRLF output by one
+    byte per line.
+    """
+    global _current_command
+    if not is_enabled():
+        yield {}
+        return
+    import shlex
+
+    record = {"argv": shlex.split(cmd), "bytes_read": 0, "returncode": 0}
+    _current_command = " ".join(record["argv"][:2])
+    started = time.perf_counter()
+    try:
+        yield record
+    finally:
+        record["duration"] = time.perf_counter() - started
+        _current_command = None
+        _subprocess_trace.append(record)
+
+def stop_and_write(output_dir):
+    """Stops profiling and writes the cProfile, subprocess and collapsed-stack reports."""
+    global _profiler, _sampler
+    if _profiler is None:
+        return
+    import io
+    import json
+    import pstats
+
+    _profiler.disable()
+    _stop_sampling.set()
+    _sampler.join()
+    profiler = _profiler
+    _profiler = None
+    _sampler = None
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Raw stats for snakeviz/pstats, plus a readable top-N listing.
+    profiler.dump_stats(os.path.join(output_dir, "cprofile.prof"))
+    listing = io.StringIO()
+    pstats.Stats(profiler, stream=listing).sort_stats("cumulative").print_stats(40)
+    with open(os.path.join(output_dir, "cprofile.txt"), "w") as f:
+        f.write(listing.getvalue())
+
+    with open(os.path.join(output_dir, "subprocess_trace.json"), "w") as f:
+        json.dump(_subprocess_trace, f, indent=2)
+
+    # Collapsed stacks: "frame;frame;frame weight" per line.
+    with open(os.path.join(output_dir, "stacks.folded"), "w") as f:
+        for stack, weight in sorted(_stacks.items()):
+            f.write(f"{stack} {weight}\n")
+
+    print_subprocess_summary()
+    print(f"Profiling output written to {output_dir}")
+
+def print_subprocess_summary():
+    """Prints subprocess count, time and bytes read grouped by git subcommand."""
+    totals = {}
+    for record in _subprocess_trace:
+        key = " ".join(record["argv"][:2])
+        count, duration, bytes_read = totals.get(key, (0, 0.0, 0))
+        totals[key] = (count + 1, duration + record["duration"], bytes_read + record["bytes_read"])
+
+    print("\nSubprocess Profile:")
+    print("-" * 25)
+    for key, (count, duration, bytes_read) in sorted(totals.items(), key=lambda item: -item[1][1]):
+        print(f"{key}: {count} calls, {duration:.3f}s, {bytes_read} bytes read")
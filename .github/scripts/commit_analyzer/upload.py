@@ -0,0 +1,78 @@
+# Signed upload of commit analyses to the API
+#
+# This module is only imported when an upload actually happens, so the HTTP
+# stack, hmac and json stay out of the startup path for analysis-only runs.
+# It uses urllib from the standard library so the CLI has no third party
+# dependencies and can ship as a self-contained zipapp.
+import hashlib
+import hmac
+import json
+import os
+import urllib.request
+
+from commit_analyzer import __version__
+from commit_analyzer.analysis import debug_log
+
+def generate_hmac_signature(data, secret_key):
+    """Generate HMAC signature for the data."""
+    # Convert data to JSON string if it's not already
+    if isinstance(data, (dict, list)):
+        data = json.dumps(data, sort_keys=True)
+
+    # Create HMAC signature using SHA256
+    signature = hmac.new(
+        secret_key.encode('utf-8'),
+        data.encode('utf-8'),
+        hashlib.sha256
+    ).hexdigest()
+
+    debug_log(f"Generated HMAC signature: {signature}")
+    return signature
+
+def send_analyses(commit_analyses):
+    """Sends the signed commit analyses to the API. Returns True on success."""
+    api_url = os.environ.get('API_URL')
+    secret_key = os.environ.get('HMAC_SECRET')
+
+    debug_log(f"API URL: {api_url}")
+    debug_log(f"Secret Key: {secret_key}")
+
+    if not api_url or not secret_key:
+        missing = []
+        if not api_url:
+            missing.append("API_URL")
+        if not secret_key:
+            missing.append("HMAC_SECRET")
+        print(f"Missing required environment variables: {', '.join(missing)}")
+        return False
+
+    # Convert data to JSON string with consistent ordering
+    json_data = json.dumps(commit_analyses, sort_keys=True)
+
+    # Generate HMAC signature
+    signature = generate_hmac_signature(json_data, secret_key)
+
+    debug_log(f"Sending data to API: {api_url}")
+    try:
+        # Request raises ValueError for a malformed URL
+        request = urllib.request.Request(
+            api_url,
+            data=json_data.encode('utf-8'),  # Send the same JSON string used for HMAC
+            headers={
+                'Content-Type': 'application/json',
+                'X-Signature': signature,
+                # Some front-ends reject urllib's default Python-urllib agent
+                'User-Agent': f'commit-analysis/{__version__}'
+            },
+            method='POST'
+        )
+        # urlopen raises HTTPError for 4xx/5xx responses
+        with urllib.request.urlopen(request) as response:
+            status = response.status
+    except (OSError, ValueError) as e:  # URLError, HTTPError, socket errors, bad URL
+        print(f"Error sending data to API: {str(e)}")
+        return False
+
+    print("Successfully sent commit analyses to API")
+    debug_log(f"API Response: {status}")
+    return True
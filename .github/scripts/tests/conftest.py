@@ -0,0 +1,48 @@
+import os
+import subprocess
+
+import pytest
+
+DAY = 24 * 60 * 60
+START = 1577836800  # 2020-01-01T00:00:00Z
+
+def git(repo, *args, timestamp=None):
+    env = dict(os.environ)
+    env.update({
+        "GIT_AUTHOR_NAME": "Test",
+        "GIT_AUTHOR_EMAIL": "test@example.com",
+        "GIT_COMMITTER_NAME": "Test",
+        "GIT_COMMITTER_EMAIL": "test@example.com",
+    })
+    if timestamp is not None:
+        env["GIT_AUTHOR_DATE"] = env["GIT_COMMITTER_DATE"] = f"{timestamp} +0000"
+    return subprocess.check_output(["git", *args], cwd=repo, env=env, text=True).strip()
+
+def commit_file(repo, lines, message, timestamp):
+    (repo / "app.txt").write_text("".join(f"{line}\n" for line in lines))
+    git(repo, "add", "app.txt")
+    git(repo, "commit", "-q", "-m", message, timestamp=timestamp)
+    return git(repo, "rev-parse", "HEAD")
+
+@pytest.fixture
+def git_repo(tmp_path, monkeypatch):
+    """A repo with four commits, returned as (path, {name: sha}).
+
+    - initial: adds lines a-d
+    - refactor: changes line b, last touched 60 days earlier
+    - rewrite: changes that line again 5 days later
+    - feature: appends a line (HEAD)
+    """
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    git(repo, "init", "-q")
+    commits = {
+        "initial": commit_file(repo, ["a", "b", "c", "d"], "initial", START),
+        "refactor": commit_file(repo, ["a", "B", "c", "d"], "refactor", START + 60 * DAY),
+        "rewrite": commit_file(repo, ["a", "BB", "c", "d"], "rewrite", START + 65 * DAY),
+        "feature": commit_file(repo, ["a", "BB", "c", "d", "e"], "feature", START + 200 * DAY),
+    }
+    monkeypatch.chdir(repo)
+    monkeypatch.delenv("PR_BASE_SHA", raising=False)
+    monkeypatch.delenv("PR_HEAD_SHA", raising=False)
+    return repo, commits
@@ -0,0 +1,71 @@
+import json
+
+import pytest
+
+from commit_analyzer import analysis, cli, upload
+
+def run_cli(*args):
+    with pytest.raises(SystemExit) as exc:
+        cli.main(list(args))
+    return exc.value.code
+
+def read_commit_ids(path):
+    return [c["commitId"] for c in json.loads(path.read_text())]
+
+@pytest.fixture
+def uploads(monkeypatch):
+    """Stubs the upload, recording each payload. Set .succeed to False to fail it."""
+    class Uploads(list):
+        succeed = True
+
+    sent = Uploads()
+
+    def fake_send_analyses(commit_analyses):
+        sent.append(commit_analyses)
+        return sent.succeed
+
+    monkeypatch.setattr(upload, "send_analyses", fake_send_analyses)
+    return sent
+
+def test_analyze_base_only_defaults_head_to_HEAD(git_repo, tmp_path):
+    _, commits = git_repo
+    output = tmp_path / "out.json"
+    assert run_cli("analyze", "--base", commits["initial"], "--no-send", "--output", str(output)) == 0
+    assert read_commit_ids(output) == [commits["feature"], commits["rewrite"], commits["refactor"]]
+
+def test_analyze_head_only_defaults_base_to_parent(git_repo, tmp_path):
+    _, commits = git_repo
+    output = tmp_path / "out.json"
+    assert run_cli("analyze", "--head", commits["rewrite"], "--no-send", "--output", str(output)) == 0
+    assert read_commit_ids(output) == [commits["rewrite"]]
+
+def test_backfill_output_then_send(git_repo, tmp_path, uploads):
+    _, commits = git_repo
+    output = tmp_path / "backfill.json"
+    assert run_cli("backfill", "--max-count", "2", "--output", str(output)) == 0
+    assert uploads == []
+    assert read_commit_ids(output) == [commits["feature"], commits["rewrite"]]
+
+    assert run_cli("send", str(output)) == 0
+    assert uploads == [json.loads(output.read_text())]
+
+def test_send_exits_nonzero_when_upload_fails(git_repo, tmp_path, uploads):
+    uploads.succeed = False
+    output = tmp_path / "out.json"
+    output.write_text("[]")
+    assert run_cli("send", str(output)) == 1
+    assert run_cli("analyze") == 1
+    assert len(uploads) == 2
+
+def test_blame_uses_analyzed_commits_parent(git_repo):
+    _, commits = git_repo
+    # Neither commit is HEAD, so blaming HEAD^ would date the wrong lines.
+    assert analysis.analyze_specific_commit(commits["refactor"])["workbreakdown"] == {
+        "newFeature": 0, "refactor": 1, "rewrite": 0,
+    }
+    assert analysis.analyze_specific_commit(commits["rewrite"])["workbreakdown"] == {
+        "newFeature": 0, "refactor": 0, "rewrite": 1,
+    }
+    assert analysis.analyze_specific_commit(commits["feature"])["workbreakdown"] == {
+        "newFeature": 1, "refactor": 0, "rewrite": 0,
+    }
@@ -0,0 +1,45 @@
+import json
+import re
+import time
+
+from commit_analyzer import analysis, profiling
+
+# flamegraph.pl's collapsed format: "frame;frame;frame weight"
+FOLDED_LINE = re.compile(r"^[^ ].*;?.* \d+$")
+
+def test_profiling_writes_subprocess_trace_and_folded_stacks(git_repo, tmp_path):
+    output_dir = tmp_path / "profile"
+    profiling.start()
+    try:
+        assert profiling.is_enabled()
+        head = analysis.run_command("git rev-parse HEAD")
+        assert analysis.run_command("git rev-parse --verify no-such-ref") == ""
+        # Give the 1ms sampler time to record some stacks.
+        time.sleep(0.02)
+    finally:
+        profiling.stop_and_write(str(output_dir))
+
+    assert not profiling.is_enabled()
+    assert {p.name for p in output_dir.iterdir()} == {
+        "cprofile.prof", "cprofile.txt", "subprocess_trace.json", "stacks.folded",
+    }
+
+    ok, failed = json.loads((output_dir / "subprocess_trace.json").read_text())
+    assert ok["argv"] == ["git", "rev-parse", "HEAD"]
+    assert ok["bytes_read"] == len(head.encode("utf-8"))
+    assert ok["returncode"] == 0
+    assert ok["duration"] > 0
+    assert failed["argv"] == ["git", "rev-parse", "--verify", "no-such-ref"]
+    assert failed["bytes_read"] == 0
+    assert failed["returncode"] != 0
+    assert failed["duration"] > 0
+
+    folded = (output_dir / "stacks.folded").read_text().splitlines()
+    assert folded
+    for line in folded:
+        assert FOLDED_LINE.match(line), line
+
+def test_trace_command_records_nothing_when_disabled(git_repo):
+    assert not profiling.is_enabled()
+    with profiling.trace_command("git rev-parse HEAD") as trace:
+        assert trace == {}
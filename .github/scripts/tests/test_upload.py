@@ -0,0 +1,77 @@
+import hashlib
+import hmac
+import json
+import urllib.error
+
+import pytest
+
+from commit_analyzer import upload
+
+ANALYSES = [
+    {
+        "commitId": "abc123",
+        "repoId": "gh_repo_1",
+        "organizationId": "gh_org_2",
+        "workbreakdown": {"newFeature": 3, "refactor": 1, "rewrite": 2},
+    }
+]
+
+class FakeResponse:
+    status = 200
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+@pytest.fixture
+def api_env(monkeypatch):
+    monkeypatch.setenv("API_URL", "https://api.example.com/analyses")
+    monkeypatch.setenv("HMAC_SECRET", "secret")
+
+@pytest.fixture
+def sent(monkeypatch):
+    requests = []
+
+    def fake_urlopen(request):
+        requests.append(request)
+        return FakeResponse()
+
+    monkeypatch.setattr(upload.urllib.request, "urlopen", fake_urlopen)
+    return requests
+
+def test_send_analyses_signs_and_posts_sorted_json(api_env, sent):
+    assert upload.send_analyses(ANALYSES) is True
+
+    [request] = sent
+    body = json.dumps(ANALYSES, sort_keys=True)
+    expected_signature = hmac.new(b"secret", body.encode("utf-8"), hashlib.sha256).hexdigest()
+    assert request.full_url == "https://api.example.com/analyses"
+    assert request.get_method() == "POST"
+    assert request.data == body.encode("utf-8")
+    assert request.get_header("Content-type") == "application/json"
+    assert request.get_header("X-signature") == expected_signature
+    assert request.get_header("User-agent").startswith("commit-analysis/")
+
+@pytest.mark.parametrize("error", [
+    urllib.error.HTTPError("https://api.example.com/analyses", 500, "Server Error", {}, None),
+    urllib.error.URLError("connection refused"),
+])
+def test_send_analyses_returns_false_on_request_error(api_env, monkeypatch, error):
+    def fake_urlopen(request):
+        raise error
+
+    monkeypatch.setattr(upload.urllib.request, "urlopen", fake_urlopen)
+    assert upload.send_analyses(ANALYSES) is False
+
+def test_send_analyses_returns_false_on_malformed_url(api_env, monkeypatch, sent):
+    monkeypatch.setenv("API_URL", "api.example.com/analyses")
+    assert upload.send_analyses(ANALYSES) is False
+    assert sent == []
+
+def test_send_analyses_returns_false_without_env(monkeypatch, sent):
+    monkeypatch.delenv("API_URL", raising=False)
+    monkeypatch.delenv("HMAC_SECRET", raising=False)
+    assert upload.send_analyses(ANALYSES) is False
+    assert sent == []